@@ -14,10 +14,8 @@
 #
 
 import json
-import os
 import sys
 
-import PIL.Image
 from pydantic import BaseModel
 from pydantic import ValidationError
 import pytest
@@ -27,12 +25,6 @@ from ... import errors
 from ... import types
 
 
-IMAGE_FILE_PATH = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '../data/google.jpg')
-)
-image = PIL.Image.open(IMAGE_FILE_PATH)
-
-
 pytestmark = pytest_helper.setup(
     file=__file__,
     globals_for_file=globals(),
@@ -102,7 +94,7 @@ def test_parts(client):
   )
 
 
-def test_image(client):
+def test_image(client, image):
   chat = client.chats.create(model='gemini-1.5-flash')
   chat.send_message(
       [
@@ -28,6 +28,11 @@ from .. import _replay_api_client
 from .. import client as google_genai_client_module
 
 
+IMAGE_FILE_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), 'data/google.jpg')
+)
+
+
 def pytest_addoption(parser):
   parser.addoption(
       '--mode',
@@ -137,3 +142,12 @@ def mock_timestamped_unique_name():
       return_value='20240101000000_bd656',
   ) as unique_name_mock:
     yield unique_name_mock
+
+
+@pytest.fixture(scope='session')
+def image():
+  # Opened on first use, so runs that deselect every image test never open
+  # the file. PIL only reads the header here; pixels are decoded on demand.
+  import PIL.Image
+
+  return PIL.Image.open(IMAGE_FILE_PATH)
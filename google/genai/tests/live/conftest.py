@@ -0,0 +1,101 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Conftest for live tests."""
+
+import os
+from unittest import mock
+
+import pytest
+
+from ... import client as gl_client
+from ... import types
+
+
+IMAGE_FILE_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '../data/google.jpg')
+)
+
+
+def _create_mock_api_client(vertexai):
+  api_client = mock.MagicMock(spec=dir(gl_client.BaseApiClient))
+  api_client.api_key = 'TEST_API_KEY'
+  api_client._host = lambda: 'test_host'
+  api_client._http_options = {'headers': {}}  # Ensure headers exist
+  api_client.vertexai = vertexai
+  return api_client
+
+
+# One mock client per API, shared by every test. Their call history and
+# auto-created child mocks persist across tests, so do not assert on calls
+# made to them; the results would depend on test order.
+_API_CLIENTS = {
+    True: _create_mock_api_client(vertexai=True),
+    False: _create_mock_api_client(vertexai=False),
+}
+
+
+class _StubWebSocket:
+  """Hand-rolled stand-in for websockets' ClientConnection."""
+
+  def __init__(self):
+    self.sent = []
+    self.closed = False
+    # Queued replies for recv(). None replies with turn complete forever.
+    self.responses = None
+
+  async def send(self, data):
+    self.sent.append(data)
+
+  async def recv(self, decode=None):
+    if self.responses is None:
+      return '{"serverContent": {"turnComplete": true}}'
+    if not self.responses:
+      # Mirrors an exhausted AsyncMock side_effect.
+      raise StopAsyncIteration
+    return self.responses.pop(0)
+
+  async def close(self):
+    self.closed = True
+
+
+@pytest.fixture(scope='session')
+def mock_api_client():
+  # For code paths that do not branch on `vertexai`.
+  return _API_CLIENTS[False]
+
+
+@pytest.fixture(scope='session')
+def make_api_client():
+  # For code paths that differ between Vertex AI and the Gemini API.
+  return lambda vertexai: _API_CLIENTS[vertexai]
+
+
+@pytest.fixture
+def mock_websocket():
+  return _StubWebSocket()
+
+
+@pytest.fixture(scope='session')
+def image_blob():
+  # Only the image send tests use this; read once per session.
+  with open(IMAGE_FILE_PATH, 'rb') as f:
+    return types.Blob(data=f.read(), mime_type='image/jpeg')
+
+
+@pytest.fixture(scope='session')
+def image_blob_list(image_blob):
+  return [image_blob, image_blob, image_blob]
@@ -0,0 +1,73 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Helpers for asserting on frames sent through the stub websocket."""
+
+from typing import Any
+
+try:
+  # orjson is optional; it parses small payloads several times faster.
+  import orjson as _json
+except ImportError:
+  import json as _json
+
+_loads = _json.loads
+
+
+def sent_payload(ws) -> Any:
+  """Returns the last frame sent on `ws`, decoded once and cached on `ws`."""
+  cached = getattr(ws, '_decoded', None)
+  if cached is None or cached[0] != len(ws.sent):
+    cached = (len(ws.sent), _loads(ws.sent[-1]))
+    ws._decoded = cached
+  return cached[1]
+
+
+def assert_sent(ws, path: str, expected: Any):
+  """Asserts the value at a dotted `path` of the last sent frame.
+
+  List indices are written as plain numbers, e.g.
+  'client_content.turns.0.parts.0.text'.
+  """
+  value = sent_payload(ws)
+  for key in path.split('.'):
+    value = value[int(key)] if isinstance(value, list) else value[key]
+  assert value == expected, f'{path}: {value!r} != {expected!r}'
+
+
+def assert_subset(actual: Any, expected: Any, path: str = ''):
+  """Asserts that `expected` is contained in `actual` in a single walk.
+
+  Dicts in `actual` may carry extra keys. Lists must have the same length and
+  are compared item by item.
+  """
+  if isinstance(expected, dict):
+    assert isinstance(actual, dict), f'{path}: {actual!r} is not a dict'
+    for key, value in expected.items():
+      key_path = f'{path}.{key}' if path else key
+      assert key in actual, f'{key_path}: missing'
+      assert_subset(actual[key], value, key_path)
+  elif isinstance(expected, list):
+    assert isinstance(actual, list), f'{path}: {actual!r} is not a list'
+    assert len(actual) == len(expected), (
+        f'{path}: length {len(actual)} != {len(expected)}'
+    )
+    for index, (actual_item, expected_item) in enumerate(
+        zip(actual, expected)
+    ):
+      assert_subset(actual_item, expected_item, f'{path}.{index}')
+  else:
+    assert actual == expected, f'{path}: {actual!r} != {expected!r}'
@@ -15,19 +15,16 @@
 
 
 """Tests for live.py."""
-import json
 from typing import AsyncIterator
-from unittest import mock
-from unittest.mock import AsyncMock
 
 import pytest
-from websockets import client
 
 from ... import _api_client as api_client
 from ... import Client
 from ... import client as gl_client
 from ... import live
 from ... import types
+from . import live_helper
 
 
 function_declarations = [{
@@ -49,32 +46,46 @@ function_declarations = [{
 }]
 
 
+# Shared payloads and their base64 forms as they appear in sent frames.
+_PCM_DATA = b'000000'
+_PCM_DATA_B64 = 'MDAwMDAw'
+_ZERO_DATA = bytes(3)
+_ZERO_DATA_B64 = 'AAAA'
+
+# Inputs are validated once here rather than in every test.
+_TEXT_CONTENT = types.LiveClientContent(
+    turns=[types.Content(parts=[types.Part(text='test')])], turn_complete=True
+)
+_PCM_BLOB = types.Blob(data=_PCM_DATA, mime_type='audio/pcm')
+_PCM_REALTIME_INPUT = types.LiveClientRealtimeInput(
+    media_chunks=[types.Blob(data=_PCM_DATA_B64, mime_type='audio/pcm')]
+)
+_ZERO_BLOB = types.Blob(data=_ZERO_DATA, mime_type='text/plain')
+_ZERO_BLOB_CONTENT = types.LiveClientContent(
+    turn_complete=False,
+    turns=[
+        types.Content(
+            parts=[types.Part(inline_data=_ZERO_BLOB)],
+            role='user',
+        )
+    ],
+)
+_ZERO_REALTIME_INPUT = types.LiveClientRealtimeInput(media_chunks=[_ZERO_BLOB])
+_FUNCTION_RESPONSE = types.FunctionResponse(
+    id='test_id',
+    name='test_name',
+    response={'result': 'test_response'},
+)
+_TOOL_RESPONSE = types.LiveClientToolResponse(
+    function_responses=[_FUNCTION_RESPONSE]
+)
+
+
 def get_current_weather(location: str, unit: str):
   """Get the current weather in a city."""
   return 15 if unit == 'C' else 59
 
 
-@pytest.fixture
-def mock_api_client(vertexai=False):
-  api_client = mock.MagicMock(spec=gl_client.BaseApiClient)
-  api_client.api_key = 'TEST_API_KEY'
-  api_client._host = lambda: 'test_host'
-  api_client._http_options = {'headers': {}}  # Ensure headers exist
-  api_client.vertexai = vertexai
-  return api_client
-
-
-@pytest.fixture
-def mock_websocket():
-  websocket = AsyncMock(spec=client.ClientConnection)
-  websocket.send = AsyncMock()
-  websocket.recv = AsyncMock(
-      return_value='{"serverContent": {"turnComplete": true}}'
-  )  # Default response
-  websocket.close = AsyncMock()
-  return websocket
-
-
 async def _async_iterator_to_list(async_iter):
   return [value async for value in async_iter]
 
@@ -114,110 +125,138 @@ def test_websocket_base_url():
 
 
 @pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope='module')
 async def test_async_session_send_text(
-    mock_api_client, mock_websocket, vertexai
+    make_api_client, mock_websocket, vertexai
 ):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=make_api_client(vertexai=vertexai), websocket=mock_websocket
   )
   await session.send(input='test')
-  mock_websocket.send.assert_called_once()
-  sent_data = json.loads(mock_websocket.send.call_args[0][0])
-  assert 'client_content' in sent_data
+  assert len(mock_websocket.sent) == 1
+  live_helper.assert_sent(
+      mock_websocket, 'client_content.turns.0.parts.0.text', 'test'
+  )
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
-async def test_async_session_send_content_dict(
-    mock_api_client, mock_websocket, vertexai
-):
+@pytest.mark.asyncio(loop_scope='module')
+async def test_async_session_send_content_dict(mock_api_client, mock_websocket):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=mock_api_client, websocket=mock_websocket
   )
   client_content = {
       'content': [{'parts': [{'text': 'test'}]}],
       'turn_complete': True,
   }
   await session.send(input=client_content)
-  mock_websocket.send.assert_called_once()
-  sent_data = json.loads(mock_websocket.send.call_args[0][0])
-  assert 'client_content' in sent_data
+  assert len(mock_websocket.sent) == 1
+  live_helper.assert_subset(
+      live_helper.sent_payload(mock_websocket),
+      {
+          'client_content': {
+              'turns': [{'parts': [{'text': 'test'}]}],
+              'turn_complete': True,
+          }
+      },
+  )
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
-async def test_async_session_send_content(
-    mock_api_client, mock_websocket, vertexai
-):
+@pytest.mark.asyncio(loop_scope='module')
+async def test_async_session_send_content(mock_api_client, mock_websocket):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=mock_api_client, websocket=mock_websocket
   )
-  client_content = types.LiveClientContent(
-      turns=[types.Content(parts=[types.Part(text='test')])], turn_complete=True
+  await session.send(input=_TEXT_CONTENT)
+  assert len(mock_websocket.sent) == 1
+  live_helper.assert_subset(
+      live_helper.sent_payload(mock_websocket),
+      {
+          'client_content': {
+              'turns': [{'parts': [{'text': 'test'}]}],
+              'turn_complete': True,
+          }
+      },
   )
-  await session.send(input=client_content)
-  mock_websocket.send.assert_called_once()
-  sent_data = json.loads(mock_websocket.send.call_args[0][0])
-  assert 'client_content' in sent_data
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
-async def test_async_session_send_bytes(
-    mock_api_client, mock_websocket, vertexai
-):
+@pytest.mark.asyncio(loop_scope='module')
+async def test_async_session_send_bytes(mock_api_client, mock_websocket):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=mock_api_client, websocket=mock_websocket
   )
-  realtime_input = {'data': b'000000', 'mime_type': 'audio/pcm'}
+  realtime_input = {'data': _PCM_DATA, 'mime_type': 'audio/pcm'}
 
   await session.send(input=realtime_input)
-  mock_websocket.send.assert_called_once()
-  sent_data = json.loads(mock_websocket.send.call_args[0][0])
-  assert 'realtime_input' in sent_data
+  assert len(mock_websocket.sent) == 1
+  live_helper.assert_sent(
+      mock_websocket, 'realtime_input.media_chunks.0.data', _PCM_DATA_B64
+  )
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
-async def test_async_session_send_blob(
-    mock_api_client, mock_websocket, vertexai
+@pytest.mark.asyncio(loop_scope='module')
+async def test_async_session_send_blob(mock_api_client, mock_websocket):
+  session = live.AsyncSession(
+      api_client=mock_api_client, websocket=mock_websocket
+  )
+  await session.send(input=_PCM_BLOB)
+  assert len(mock_websocket.sent) == 1
+  live_helper.assert_sent(
+      mock_websocket, 'realtime_input.media_chunks.0.data', _PCM_DATA_B64
+  )
+
+
+@pytest.mark.asyncio(loop_scope='module')
+async def test_async_session_send_image_blob(
+    mock_api_client, mock_websocket, image_blob
 ):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=mock_api_client, websocket=mock_websocket
   )
-  realtime_input = types.Blob(data=b'000000', mime_type='audio/pcm')
 
-  await session.send(input=realtime_input)
-  mock_websocket.send.assert_called_once()
-  sent_data = json.loads(mock_websocket.send.call_args[0][0])
-  assert 'realtime_input' in sent_data
+  await session.send(input=image_blob)
+  assert len(mock_websocket.sent) == 1
+  live_helper.assert_sent(
+      mock_websocket, 'realtime_input.media_chunks.0.mime_type', 'image/jpeg'
+  )
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope='module')
+async def test_async_session_send_blob_list(
+    mock_api_client, mock_websocket, image_blob_list
+):
+  session = live.AsyncSession(
+      api_client=mock_api_client, websocket=mock_websocket
+  )
+
+  await session.send(input=image_blob_list)
+  assert len(mock_websocket.sent) == 1
+  live_helper.assert_subset(
+      live_helper.sent_payload(mock_websocket),
+      {'realtime_input': {'media_chunks': [{'mime_type': 'image/jpeg'}] * 3}},
+  )
+
+
+@pytest.mark.asyncio(loop_scope='module')
 async def test_async_session_send_realtime_input(
-    mock_api_client, mock_websocket, vertexai
+    mock_api_client, mock_websocket
 ):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=mock_api_client, websocket=mock_websocket
   )
-  realtime_input = types.LiveClientRealtimeInput(
-      media_chunks=[types.Blob(data='MDAwMDAw', mime_type='audio/pcm')]
+  await session.send(input=_PCM_REALTIME_INPUT)
+  assert len(mock_websocket.sent) == 1
+  live_helper.assert_sent(
+      mock_websocket, 'realtime_input.media_chunks.0.mime_type', 'audio/pcm'
   )
-  await session.send(input=realtime_input)
-  mock_websocket.send.assert_called_once()
-  sent_data = json.loads(mock_websocket.send.call_args[0][0])
-  assert 'realtime_input' in sent_data
 
 
 @pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope='module')
 async def test_async_session_send_tool_response(
-    mock_api_client, mock_websocket, vertexai
+    make_api_client, mock_websocket, vertexai
 ):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=make_api_client(vertexai=vertexai), websocket=mock_websocket
   )
 
   if vertexai:
@@ -240,33 +279,28 @@ async def test_async_session_send_tool_response(
         ]
     )
   await session.send(input=tool_response)
-  mock_websocket.send.assert_called_once()
-  sent_data = json.loads(mock_websocket.send.call_args[0][0])
-  assert 'tool_response' in sent_data
+  assert len(mock_websocket.sent) == 1
+  live_helper.assert_sent(
+      mock_websocket,
+      'tool_response.function_responses.0.name',
+      'get_current_weather',
+  )
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
-async def test_async_session_send_input_none(
-    mock_api_client, mock_websocket, vertexai
-):
+@pytest.mark.asyncio(loop_scope='module')
+async def test_async_session_send_input_none(mock_api_client, mock_websocket):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=mock_api_client, websocket=mock_websocket
   )
   await session.send(input=None)
-  mock_websocket.send.assert_called_once()
-  sent_data = json.loads(mock_websocket.send.call_args[0][0])
-  assert 'client_content' in sent_data
-  assert sent_data['client_content']['turn_complete']
+  assert len(mock_websocket.sent) == 1
+  live_helper.assert_sent(mock_websocket, 'client_content.turn_complete', True)
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
-async def test_async_session_send_error(
-    mock_api_client, mock_websocket, vertexai
-):
+@pytest.mark.asyncio(loop_scope='module')
+async def test_async_session_send_error(mock_api_client, mock_websocket):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=mock_api_client, websocket=mock_websocket
   )
   with pytest.raises(ValueError):
     await session.send(input=[{'invalid_key': 'invalid_value'}])
@@ -276,10 +310,10 @@ async def test_async_session_send_error(
 
 
 @pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
-async def test_async_session_receive(mock_api_client, mock_websocket, vertexai):
+@pytest.mark.asyncio(loop_scope='module')
+async def test_async_session_receive(make_api_client, mock_websocket, vertexai):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=make_api_client(vertexai=vertexai), websocket=mock_websocket
   )
   responses = session.receive()
   responses = await _async_iterator_to_list(responses)
@@ -287,31 +321,29 @@ async def test_async_session_receive(mock_api_client, mock_websocket, vertexai):
 
 
 @pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope='module')
 async def test_async_session_receive_error(
-    mock_api_client, mock_websocket, vertexai
+    make_api_client, mock_websocket, vertexai
 ):
-  mock_websocket.recv = AsyncMock(return_value='invalid json')
+  mock_websocket.responses = ['invalid json']
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=make_api_client(vertexai=vertexai), websocket=mock_websocket
   )
   with pytest.raises(ValueError):
     await session.receive().__anext__()
 
 
 @pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope='module')
 async def test_async_session_receive_text(
-    mock_api_client, mock_websocket, vertexai
+    make_api_client, mock_websocket, vertexai
 ):
-  mock_websocket.recv = AsyncMock(
-      side_effect=[
-          '{"serverContent": {"modelTurn": {"parts":[{"text": "test"}]}}}',
-          '{"serverContent": {"turnComplete": true}}',
-      ]
-  )
+  mock_websocket.responses = [
+      '{"serverContent": {"modelTurn": {"parts":[{"text": "test"}]}}}',
+      '{"serverContent": {"turnComplete": true}}',
+  ]
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=make_api_client(vertexai=vertexai), websocket=mock_websocket
   )
   messages = session.receive()
   messages = await _async_iterator_to_list(messages)
@@ -321,21 +353,19 @@ async def test_async_session_receive_text(
 
 
 @pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope='module')
 async def test_async_session_receive_audio(
-    mock_api_client, mock_websocket, vertexai
+    make_api_client, mock_websocket, vertexai
 ):
-  mock_websocket.recv = AsyncMock(
-      side_effect=[
-          (
-              '{"serverContent": {"modelTurn": {"parts":[{"inlineData":'
-              ' {"data": "MDAwMDAw", "mime_type": "audio/pcm" }}]}}}'
-          ),
-          '{"serverContent": {"turnComplete": true}}',
-      ]
-  )
+  mock_websocket.responses = [
+      (
+          '{"serverContent": {"modelTurn": {"parts":[{"inlineData":'
+          ' {"data": "MDAwMDAw", "mime_type": "audio/pcm" }}]}}}'
+      ),
+      '{"serverContent": {"turnComplete": true}}',
+  ]
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=make_api_client(vertexai=vertexai), websocket=mock_websocket
   )
   messages = session.receive()
   messages = await _async_iterator_to_list(messages)
@@ -346,7 +376,7 @@ async def test_async_session_receive_audio(
   )
   assert (
       messages[0].server_content.model_turn.parts[0].inline_data.data
-      == b'000000'
+      == _PCM_DATA
   )
 
   with pytest.raises(RuntimeError):
@@ -354,22 +384,20 @@ async def test_async_session_receive_audio(
 
 
 @pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope='module')
 async def test_async_session_receive_tool_call(
-    mock_api_client, mock_websocket, vertexai
+    make_api_client, mock_websocket, vertexai
 ):
-  mock_websocket.recv = AsyncMock(
-      side_effect=[
-          (
-              '{"toolCall": {"functionCalls": [{"name":'
-              ' "get_current_weather", "args": {"location": "San Francisco",'
-              ' "unit": "C"}}]}}'
-          ),
-          '{"serverContent": {"turnComplete": true}}',
-      ]
-  )
+  mock_websocket.responses = [
+      (
+          '{"toolCall": {"functionCalls": [{"name":'
+          ' "get_current_weather", "args": {"location": "San Francisco",'
+          ' "unit": "C"}}]}}'
+      ),
+      '{"serverContent": {"turnComplete": true}}',
+  ]
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=make_api_client(vertexai=vertexai), websocket=mock_websocket
   )
   messages = session.receive()
   messages = await _async_iterator_to_list(messages)
@@ -386,13 +414,13 @@ async def test_async_session_receive_tool_call(
 
 
 @pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope='module')
 async def test_async_session_start_stream(
-    mock_api_client, mock_websocket, vertexai
+    make_api_client, mock_websocket, vertexai
 ):
 
   session = live.AsyncSession(
-      mock_api_client(vertexai=vertexai), mock_websocket
+      make_api_client(vertexai=vertexai), mock_websocket
   )
 
   async def mock_stream():
@@ -405,24 +433,21 @@ async def test_async_session_start_stream(
     assert isinstance(message, types.LiveServerMessage)
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-@pytest.mark.asyncio
-async def test_async_session_close(mock_api_client, mock_websocket, vertexai):
-  session = live.AsyncSession(
-      mock_api_client(vertexai=vertexai), mock_websocket
-  )
+@pytest.mark.asyncio(loop_scope='module')
+async def test_async_session_close(mock_api_client, mock_websocket):
+  session = live.AsyncSession(mock_api_client, mock_websocket)
   await session.close()
-  mock_websocket.close.assert_called_once()
+  assert mock_websocket.closed
 
 
 def test_bidi_setup_to_api_no_config(mock_api_client):
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_mldev(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_mldev(
       model='test_model'
   )
   expected_result = {'setup': {'model': 'test_model'}}
   assert result == expected_result
 
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_vertex(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_vertex(
       model='test_model'
   )
   expected_result = {
@@ -449,7 +474,7 @@ def test_bidi_setup_to_api_speech_config(mock_api_client):
       }
   }
   config_dict = {'speech_config': 'en-default'}
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_mldev(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_mldev(
       model='test_model', config=config_dict
   )
   assert result == expected_result
@@ -463,11 +488,11 @@ def test_bidi_setup_to_api_speech_config(mock_api_client):
           )
       )
   )
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_mldev(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_mldev(
       model='test_model', config=config
   )
   assert result == expected_result
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_vertex(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_vertex(
       model='test_model', config=config
   )
   expected_result['setup']['generationConfig'].update(
@@ -502,13 +527,13 @@ def test_bidi_setup_to_api_with_config_tools_google_search_retrieval(
       }
   }
   # Test for mldev, config is a LiveConnectConfig
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_mldev(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_mldev(
       model='test_model', config=config
   )
   assert result == expected_result
 
   # Test for vertex, config is a LiveConnectConfig
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_vertex(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_vertex(
       model='test_model', config=config
   )
   assert result == expected_result
@@ -545,7 +570,7 @@ def test_bidi_setup_to_api_with_config_tools_function_declaration(
           }],
       }
   }
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_mldev(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_mldev(
       model='test_model', config=config
   )
 
@@ -557,7 +582,7 @@ def test_bidi_setup_to_api_with_config_tools_function_declaration(
       ]
   )
 
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_vertex(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_vertex(
       model='test_model', config=config
   )
   assert result['setup']['tools'][0]['functionDeclarations'][0][
@@ -600,7 +625,7 @@ def test_bidi_setup_to_api_with_config_tools_function_directly(
           }],
       }
   }
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_mldev(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_mldev(
       model='test_model', config=config
   )
 
@@ -612,7 +637,7 @@ def test_bidi_setup_to_api_with_config_tools_function_directly(
       ]
   )
 
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_vertex(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_vertex(
       model='test_model', config=config
   )
   assert result['setup']['tools'][0]['functionDeclarations'][0][
@@ -639,22 +664,22 @@ def test_bidi_setup_to_api_with_config_tools_code_execution(
           }],
       }
   }
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_mldev(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_mldev(
       model='test_model', config=config
   )
 
   assert result['setup']['tools'][0] == expected_result['setup']['tools'][0]
 
-  result = live.AsyncLive(mock_api_client())._LiveSetup_to_vertex(
+  result = live.AsyncLive(mock_api_client)._LiveSetup_to_vertex(
       model='test_model', config=config
   )
   assert result['setup']['tools'][0] == expected_result['setup']['tools'][0]
 
 
 @pytest.mark.parametrize('vertexai', [True, False])
-def test_parse_client_message_str(mock_api_client, mock_websocket, vertexai):
+def test_parse_client_message_str(make_api_client, mock_websocket, vertexai):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=make_api_client(vertexai=vertexai), websocket=mock_websocket
   )
   result = session._parse_client_message('test')
   assert 'client_content' in result
@@ -669,47 +694,35 @@ def test_parse_client_message_str(mock_api_client, mock_websocket, vertexai):
   assert types.LiveClientMessage(**result)
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-def test_parse_client_message_blob(mock_api_client, mock_websocket, vertexai):
+def test_parse_client_message_blob(mock_api_client, mock_websocket):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
-  )
-  result = session._parse_client_message(
-      types.Blob(data=bytes([0, 0, 0]), mime_type='text/plain')
+      api_client=mock_api_client, websocket=mock_websocket
   )
+  result = session._parse_client_message(_ZERO_BLOB)
   assert 'realtime_input' in result
   assert result == {
       'realtime_input': {
-          'media_chunks': [{'mime_type': 'text/plain', 'data': 'AAAA'}],
+          'media_chunks': [{'mime_type': 'text/plain', 'data': _ZERO_DATA_B64}],
       }
   }
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-def test_parse_client_message_blob_dict(
-    mock_api_client, mock_websocket, vertexai
-):
+def test_parse_client_message_blob_dict(mock_api_client, mock_websocket):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=mock_api_client, websocket=mock_websocket
   )
-
-  blob = types.Blob(data=bytes([0, 0, 0]), mime_type='text/plain')
-  blob_dict = blob.model_dump()
-  result = session._parse_client_message(blob_dict)
+  result = session._parse_client_message(_ZERO_BLOB.model_dump())
   assert 'realtime_input' in result
   assert result == {
       'realtime_input': {
-          'media_chunks': [{'mime_type': 'text/plain', 'data': 'AAAA'}],
+          'media_chunks': [{'mime_type': 'text/plain', 'data': _ZERO_DATA_B64}],
       }
   }
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-def test_parse_client_message_client_content(
-    mock_api_client, mock_websocket, vertexai
-):
+def test_parse_client_message_client_content(mock_api_client, mock_websocket):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=mock_api_client, websocket=mock_websocket
   )
   result = session._parse_client_message(
       types.LiveClientContent(
@@ -726,29 +739,13 @@ def test_parse_client_message_client_content(
   }
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
 def test_parse_client_message_client_content_blob(
-    mock_api_client, mock_websocket, vertexai
+    mock_api_client, mock_websocket
 ):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
-  )
-  client_content = types.LiveClientContent(
-      turn_complete=False,
-      turns=[
-          types.Content(
-              parts=[
-                  types.Part(
-                      inline_data=types.Blob(
-                          data=bytes([0, 0, 0]), mime_type='text/plain'
-                      )
-                  )
-              ],
-              role='user',
-          )
-      ],
+      api_client=mock_api_client, websocket=mock_websocket
   )
-  result = session._parse_client_message(client_content)
+  result = session._parse_client_message(_ZERO_BLOB_CONTENT)
   assert 'client_content' in result
   assert (
       type(
@@ -763,38 +760,25 @@ def test_parse_client_message_client_content_blob(
           'turn_complete': False,
           'turns': [{
               'role': 'user',
-              'parts': [
-                  {'inline_data': {'mime_type': 'text/plain', 'data': 'AAAA'}}
-              ],
+              'parts': [{
+                  'inline_data': {
+                      'mime_type': 'text/plain',
+                      'data': _ZERO_DATA_B64,
+                  }
+              }],
           }],
       }
   }
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
 def test_parse_client_message_client_content_dict(
-    mock_api_client, mock_websocket, vertexai
+    mock_api_client, mock_websocket
 ):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
-  )
-  client_content = types.LiveClientContent(
-      turn_complete=False,
-      turns=[
-          types.Content(
-              parts=[
-                  types.Part(
-                      inline_data=types.Blob(
-                          data=bytes([0, 0, 0]), mime_type='text/plain'
-                      )
-                  )
-              ],
-              role='user',
-          )
-      ],
+      api_client=mock_api_client, websocket=mock_websocket
   )
   result = session._parse_client_message(
-      client_content.model_dump(mode='json', exclude_none=True)
+      _ZERO_BLOB_CONTENT.model_dump(mode='json', exclude_none=True)
   )
   assert 'client_content' in result
   assert (
@@ -810,167 +794,70 @@ def test_parse_client_message_client_content_dict(
           'turn_complete': False,
           'turns': [{
               'role': 'user',
-              'parts': [
-                  {'inline_data': {'mime_type': 'text/plain', 'data': 'AAAA'}}
-              ],
+              'parts': [{
+                  'inline_data': {
+                      'mime_type': 'text/plain',
+                      'data': _ZERO_DATA_B64,
+                  }
+              }],
           }],
       }
   }
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
-def test_parse_client_message_realtime_input(
-    mock_api_client, mock_websocket, vertexai
-):
+def test_parse_client_message_realtime_input(mock_api_client, mock_websocket):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+      api_client=mock_api_client, websocket=mock_websocket
   )
-  input = types.LiveClientRealtimeInput(
-      media_chunks=[types.Blob(data=bytes([0, 0, 0]), mime_type='text/plain')]
-  )
-  result = session._parse_client_message(input)
+  result = session._parse_client_message(_ZERO_REALTIME_INPUT)
   assert 'realtime_input' in result
   assert result == {
       'realtime_input': {
-          'media_chunks': [{'mime_type': 'text/plain', 'data': 'AAAA'}],
+          'media_chunks': [{'mime_type': 'text/plain', 'data': _ZERO_DATA_B64}],
       }
   }
 
 
-@pytest.mark.parametrize('vertexai', [True, False])
 def test_parse_client_message_realtime_input_dict(
-    mock_api_client, mock_websocket, vertexai
+    mock_api_client, mock_websocket
 ):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
-  )
-  input = types.LiveClientRealtimeInput(
-      media_chunks=[types.Blob(data=bytes([0, 0, 0]), mime_type='text/plain')]
+      api_client=mock_api_client, websocket=mock_websocket
   )
   result = session._parse_client_message(
-      input.model_dump(mode='json', exclude_none=True)
+      _ZERO_REALTIME_INPUT.model_dump(mode='json', exclude_none=True)
   )
   assert 'realtime_input' in result
   assert result == {
       'realtime_input': {
-          'media_chunks': [{'mime_type': 'text/plain', 'data': 'AAAA'}],
+          'media_chunks': [{'mime_type': 'text/plain', 'data': _ZERO_DATA_B64}],
       }
   }
 
 
 @pytest.mark.parametrize('vertexai', [True, False])
+@pytest.mark.parametrize(
+    'tool_response_input',
+    [
+        pytest.param(_TOOL_RESPONSE, id='tool_response'),
+        pytest.param(_FUNCTION_RESPONSE, id='function_response'),
+        pytest.param(
+            _FUNCTION_RESPONSE.model_dump(mode='json', exclude_none=True),
+            id='function_response_dict',
+        ),
+        pytest.param(
+            _TOOL_RESPONSE.model_dump(mode='json', exclude_none=True),
+            id='tool_response_dict',
+        ),
+    ],
+)
 def test_parse_client_message_tool_response(
-    mock_api_client, mock_websocket, vertexai
-):
-  session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
-  )
-  input = types.LiveClientToolResponse(
-      function_responses=[
-          types.FunctionResponse(
-              id='test_id',
-              name='test_name',
-              response={'result': 'test_response'},
-          )
-      ]
-  )
-  result = session._parse_client_message(input)
-  assert 'tool_response' in result
-  assert result == {
-      'tool_response': {
-          'function_responses': [
-              {
-                  'id': 'test_id',
-                  'name': 'test_name',
-                  'response': {
-                      'result': 'test_response',
-                  },
-              },
-          ],
-      }
-  }
-
-
-@pytest.mark.parametrize('vertexai', [True, False])
-def test_parse_client_message_function_response(
-    mock_api_client, mock_websocket, vertexai
-):
-  session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
-  )
-  input = types.FunctionResponse(
-    id='test_id',
-    name='test_name',
-    response={'result': 'test_response'},
-  )
-  result = session._parse_client_message(input)
-  assert 'tool_response' in result
-  assert result == {
-      'tool_response': {
-          'function_responses': [
-              {
-                  'id': 'test_id',
-                  'name': 'test_name',
-                  'response': {
-                      'result': 'test_response',
-                  },
-              },
-          ],
-      }
-  }
-
-
-@pytest.mark.parametrize('vertexai', [True, False])
-def test_parse_client_message_tool_response_dict_with_only_response(
-    mock_api_client, mock_websocket, vertexai
-):
-  session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
-  )
-  input = {
-    'id': 'test_id',
-    'name': 'test_name',
-    'response': {
-        'result': 'test_response',
-    }
-  }
-  result = session._parse_client_message(input)
-  assert 'tool_response' in result
-  assert result == {
-      'tool_response': {
-          'function_responses': [
-              {
-                  'id': 'test_id',
-                  'name': 'test_name',
-                  'response': {
-                      'result': 'test_response',
-                  },
-              },
-          ],
-      }
-  }
-
-
-@pytest.mark.parametrize('vertexai', [True, False])
-def test_parse_client_message_realtime_tool_response(
-    mock_api_client, mock_websocket, vertexai
+    make_api_client, mock_websocket, vertexai, tool_response_input
 ):
   session = live.AsyncSession(
-      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
-  )
-  input = types.LiveClientToolResponse(
-      function_responses=[
-          types.FunctionResponse(
-              id='test_id',
-              name='test_name',
-              response={'result': 'test_response'},
-          )
-      ]
-  )
-
-  result = session._parse_client_message(
-      input.model_dump(mode='json', exclude_none=True)
+      api_client=make_api_client(vertexai=vertexai), websocket=mock_websocket
   )
+  result = session._parse_client_message(tool_response_input)
   assert 'tool_response' in result
   assert result == {
       'tool_response': {
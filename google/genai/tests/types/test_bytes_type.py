@@ -100,7 +100,7 @@ class MyAnyModel(_common.BaseModel):
 # This test shows that if user pass in raw bytes to an Any type field,
 # then SDK will return raw bytes in pydantic, model_dump() and __str__()
 # and base64 string in to_json_dict() and model_dump(mode='json').
-def test_any_type_urlsafe_base64_input():
+def test_any_type_raw_bytes_input():
   my_data = MyAnyModel(data=_RAW_BYTES)
 
   # Check output is base64 string.
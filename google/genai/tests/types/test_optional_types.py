@@ -14,19 +14,34 @@
 #
 
 
+import importlib.util
 from unittest.mock import patch
 
+from ... import types as cached_types
+
+
+def _load_types_module():
+  # Executes types.py again so that its PIL import is re-evaluated, without
+  # replacing the cached module that the other tests use.
+  spec = importlib.util.spec_from_file_location(
+      f'{cached_types.__package__}._types_reloaded', cached_types.__file__
+  )
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  return module
+
 
 @patch.dict('sys.modules', {'PIL': None, 'PIL.Image': None})
 def test_without_pil_installed_mocked():
-  from ... import types
+  types = _load_types_module()
 
   type_names_in_union = [
       arg.__name__ if hasattr(arg, '__name__') else str(arg)
       for arg in types.PartUnion.__args__]
   assert 'Image' not in type_names_in_union
 
-def test_without_pil_installed_mocked():
+
+def test_with_pil_installed():
   from ... import types
 
   type_names_in_union = [